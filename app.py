@@ -1,47 +1,106 @@
 """
-AI Blog Generator - Flask Backend
-A simple Flask application that generates blog posts using OpenAI API
+AI Blog Generator - Quart Backend
+An async Quart application that generates blog posts using OpenAI API
 """
 
-from flask import Flask, render_template, request, jsonify
-from openai import OpenAI
-from openai import APIError, RateLimitError, APIConnectionError, Timeout
+from quart import Quart, render_template, request, jsonify
+from quart.json.provider import DefaultJSONProvider
+from openai import AsyncOpenAI
+from openai import APIError, RateLimitError, APIConnectionError, APITimeoutError
+import httpx
+import tiktoken
+from aiolimiter import AsyncLimiter
+import asyncio
+import atexit
+import hashlib
+import orjson
 import os
+import queue
 import re
 import logging
 import time
-from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+import uuid
+from collections import OrderedDict
+from functools import lru_cache, wraps
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging through a queue: records are enqueued on the request
+# path (cheap) and formatted/flushed to the stream on a dedicated listener
+# thread, keeping synchronous stdout I/O off the hot path
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, _log_output)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson's Rust encoder (~3-5x faster than stdlib)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# Initialize Quart app
+app = Quart(__name__)
+app.json = ORJSONProvider(app)
 
 # Configuration constants
 MAX_TOPIC_LENGTH = 200
+MAX_TOPIC_TOKENS = 120  # reject token-dense inputs (e.g. CJK) before paying for them
 MIN_TOPIC_LENGTH = 3
 MAX_TOKENS = 800
 TEMPERATURE = 0.7
 MODEL = "gpt-3.5-turbo"
 REQUEST_TIMEOUT = 60  # seconds
 
+# Response cache configuration
+CACHE_MAX_SIZE = 1024  # max cached responses kept in memory
+
+# Batch API configuration
+MAX_BATCH_TOPICS = 100  # max topics accepted per bulk submission
+
+# Client-side rate limits matching the OpenAI account tier, so requests
+# queue locally instead of burning a round-trip on a remote 429
+RPM_LIMIT = 3500  # requests per minute
+TPM_LIMIT = 90000  # tokens per minute
+
+# Request batching configuration
+MAX_BATCH = 8  # max completion calls dispatched per batch
+BATCH_WINDOW_MS = 50  # how long to wait for more requests to coalesce
+MAX_CONCURRENCY = 16  # cap on simultaneous in-flight OpenAI calls
+
 # Initialize OpenAI client with API key from environment variable
 api_key = os.getenv('OPENAI_API_KEY')
 if not api_key:
     logger.error("OPENAI_API_KEY not found in environment variables")
     raise ValueError("OPENAI_API_KEY environment variable is required")
 
-client = OpenAI(api_key=api_key, timeout=REQUEST_TIMEOUT)
+# Share one httpx connection pool across all OpenAI calls so keep-alive
+# connections are reused process-wide instead of paying a TCP+TLS
+# handshake per request. HTTP/2 multiplexes concurrent calls over a few
+# long-lived TLS sessions, so the pool can be far smaller than it would
+# need to be with one connection per in-flight request
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=httpx.Timeout(REQUEST_TIMEOUT)
+)
+client = AsyncOpenAI(api_key=api_key, http_client=http_client)
 
 # Request statistics tracking
 request_stats = {
@@ -53,22 +112,221 @@ request_stats = {
 }
 
 
+# Bounded LRU cache of response payloads so popular topics are served
+# from memory instead of re-generating the same post on every hit
+_response_cache = OrderedDict()
+_cache_lock = asyncio.Lock()
+
+
+def cache_key(topic):
+    """Build a cache key covering the topic and the generation parameters"""
+    raw = f"{MODEL}:{MAX_TOKENS}:{TEMPERATURE}:{topic.lower()}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def cache_get(key):
+    """Return the cached payload for key (marking it recently used), or None"""
+    async with _cache_lock:
+        payload = _response_cache.get(key)
+        if payload is not None:
+            _response_cache.move_to_end(key)
+        return payload
+
+
+async def cache_put(key, payload):
+    """Store a payload under key, evicting the least recently used entry"""
+    async with _cache_lock:
+        _response_cache[key] = payload
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > CACHE_MAX_SIZE:
+            _response_cache.popitem(last=False)
+
+
+# Tokenizer for the configured model, loaded once at import (tiktoken is
+# Rust-backed and fast, but the vocabulary load is not free). Falls back to
+# None when the encoding cannot be loaded (e.g. offline environments), in
+# which case token counts degrade to the ~4 chars/token estimate
+try:
+    _ENC = tiktoken.encoding_for_model(MODEL)
+except KeyError:
+    _ENC = tiktoken.get_encoding('cl100k_base')
+except Exception as e:
+    logger.warning("Could not load tiktoken encoding, using char estimate: %s", e)
+    _ENC = None
+
+
+def count_tokens(text):
+    """Token count for text: exact via tiktoken, else ~4 chars per token"""
+    if _ENC is not None:
+        return len(_ENC.encode(text))
+    return len(text) // 4 + 1
+
+
+# Token buckets for proactive throttling: one for request rate, one for
+# token throughput estimated from the prompt size
+_rpm_limiter = AsyncLimiter(RPM_LIMIT, 60)
+_tpm_limiter = AsyncLimiter(TPM_LIMIT, 60)
+
+
+def estimate_tokens(messages):
+    """
+    Prompt-token count plus the completion budget, used to charge the TPM
+    bucket before a call goes out
+    """
+    prompt_tokens = sum(count_tokens(m['content']) for m in messages)
+    return prompt_tokens + MAX_TOKENS
+
+
+async def acquire_rate_limit(messages):
+    """Wait for RPM and TPM budget before dispatching an OpenAI call"""
+    await _rpm_limiter.acquire()
+    await _tpm_limiter.acquire(min(estimate_tokens(messages), TPM_LIMIT))
+
+
+# Micro-batcher state: handlers enqueue (messages, future) pairs and a
+# background task coalesces requests that arrive close together, firing
+# them concurrently under a shared semaphore to amortize per-request
+# overhead and smooth out RPM usage
+_batch_queue = asyncio.Queue()
+_llm_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+_batcher_task = None
+_dispatch_tasks = set()
+
+
+async def _call_openai(messages, future):
+    """Execute a single completion call and resolve the caller's future"""
+    async with _llm_semaphore:
+        try:
+            await acquire_rate_limit(messages)
+            response = await client.chat.completions.create(
+                model=MODEL,
+                messages=messages,
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE
+            )
+        except Exception as e:
+            if not future.cancelled():
+                future.set_exception(e)
+        else:
+            if not future.cancelled():
+                future.set_result(response)
+
+
+async def _batch_dispatcher():
+    """
+    Background task that drains the batch queue
+    Collects up to MAX_BATCH requests arriving within BATCH_WINDOW_MS,
+    then dispatches them concurrently
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _batch_queue.get()]
+        deadline = loop.time() + BATCH_WINDOW_MS / 1000
+        while len(batch) < MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_batch_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        if len(batch) > 1:
+            logger.info("Dispatching batch of %d completion calls", len(batch))
+        # Fire the batch without blocking the dispatcher loop; the
+        # semaphore inside _call_openai bounds actual concurrency
+        task = asyncio.ensure_future(
+            asyncio.gather(*(_call_openai(m, f) for m, f in batch))
+        )
+        _dispatch_tasks.add(task)
+        task.add_done_callback(_dispatch_tasks.discard)
+
+
+async def generate_completion(messages):
+    """
+    Enqueue a completion request for the micro-batcher and await its result
+    Raises whatever exception the underlying OpenAI call raised
+    """
+    future = asyncio.get_running_loop().create_future()
+    await _batch_queue.put((messages, future))
+    return await future
+
+
+@app.before_serving
+async def _start_batcher():
+    """Start the batch dispatcher on the serving event loop"""
+    global _batcher_task
+    _batcher_task = asyncio.ensure_future(_batch_dispatcher())
+
+
+@app.after_serving
+async def _stop_batcher():
+    """Cancel the batch dispatcher on shutdown"""
+    if _batcher_task:
+        _batcher_task.cancel()
+
+
+@app.after_serving
+async def _close_http_client():
+    """Close the shared connection pool on shutdown"""
+    await http_client.aclose()
+
+
+# Sanitization translate table: strips control characters in a single
+# C-level pass (keeping newlines and tabs)
+_CTRL_TABLE = dict.fromkeys(
+    list(range(0, 9)) + [11, 12] + list(range(14, 32)) + list(range(127, 160)),
+    None
+)
+
+
+def sse_event(payload):
+    """Format a dict as a Server-Sent Events data frame"""
+    return b'data: ' + orjson.dumps(payload) + b'\n\n'
+
+
+# Matches one whitespace-delimited word; used to count words in generated
+# posts without materializing the list that str.split() would allocate
+_WORD_RE = re.compile(r'\S+')
+
+
+def count_words(text):
+    """Count whitespace-delimited words, same result as len(text.split())"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _scrub_input(text):
+    """Strip control characters and collapse whitespace runs"""
+    # Remove control characters except newlines and tabs
+    text = text.translate(_CTRL_TABLE)
+    # Collapse whitespace runs to single spaces; split/join does this in
+    # one C-level pass, no regex engine on the hot validation path
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=2048)
+def _sanitize_input_cached(text):
+    """Memoized scrubbing pass for inputs small enough to retain"""
+    return _scrub_input(text)
+
+
 def sanitize_input(text):
     """
     Sanitize user input to prevent injection attacks
     Remove potentially harmful characters while preserving content
+    Only topic-sized inputs go through the lru_cache: it runs before
+    length validation and its entries live for the process lifetime, so
+    memoizing arbitrarily large request bodies would let an attacker pin
+    them in memory
     """
     if not text:
         return ""
-    # Remove control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]', '', text)
-    # Limit consecutive whitespace
-    text = re.sub(r'\s{3,}', ' ', text)
-    return text.strip()
+    if len(text) > MAX_TOPIC_LENGTH:
+        return _scrub_input(text)
+    return _sanitize_input_cached(text)
 
 
 @app.route('/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint for monitoring"""
     return jsonify({
         'status': 'healthy',
@@ -84,7 +342,7 @@ def health_check():
 
 
 @app.route('/suggestions', methods=['GET'])
-def get_topic_suggestions():
+async def get_topic_suggestions():
     """Get topic suggestions for users"""
     suggestions = [
         "The Future of Artificial Intelligence",
@@ -106,14 +364,190 @@ def get_topic_suggestions():
     return jsonify({'suggestions': suggestions}), 200
 
 
+# The landing page takes no request-bound context, so it is rendered once
+# and served as a cached string with an ETag instead of going through
+# Jinja on every hit
+_index_html = None
+_index_etag = None
+
+
+async def _load_index():
+    """Render the landing page once and precompute its ETag"""
+    global _index_html, _index_etag
+    if _index_html is None:
+        _index_html = await render_template('index.html')
+        _index_etag = f'"{hashlib.md5(_index_html.encode()).hexdigest()}"'
+
+
+@app.before_serving
+async def _warm_index():
+    """Pre-render the landing page at startup"""
+    await _load_index()
+
+
 @app.route('/')
-def index():
-    """Render the main page with the blog generator form"""
-    return render_template('index.html')
+async def index():
+    """Serve the cached main page with client-side caching headers"""
+    await _load_index()
+
+    headers = {
+        'Cache-Control': 'public, max-age=3600',
+        'ETag': _index_etag
+    }
+
+    # Revalidation: the browser already has this exact page cached
+    if request.headers.get('If-None-Match') == _index_etag:
+        return '', 304, headers
+
+    headers['Content-Type'] = 'text/html; charset=utf-8'
+    return _index_html, 200, headers
+
+
+def validate_topic(raw_topic):
+    """
+    Sanitize and validate a raw topic string
+    Returns (topic, None) on success or (None, error_message) on failure
+    """
+    topic = sanitize_input(raw_topic.strip())
+
+    if not topic:
+        logger.warning("Empty topic received")
+        return None, 'Please enter a blog topic'
+
+    if len(topic) < MIN_TOPIC_LENGTH:
+        logger.warning("Topic too short: %d characters", len(topic))
+        return None, f'Topic must be at least {MIN_TOPIC_LENGTH} characters long'
+
+    if len(topic) > MAX_TOPIC_LENGTH:
+        logger.warning("Topic too long: %d characters", len(topic))
+        return None, f'Topic must not exceed {MAX_TOPIC_LENGTH} characters'
+
+    # Character length is a poor proxy for what OpenAI bills; reject
+    # token-dense inputs before paying the network round-trip for them
+    topic_tokens = count_tokens(topic)
+    if topic_tokens > MAX_TOPIC_TOKENS:
+        logger.warning("Topic too token-dense: %d tokens", topic_tokens)
+        return None, f'Topic must not exceed {MAX_TOPIC_TOKENS} tokens'
+
+    return topic, None
+
+
+# Static instruction block shared by every request. All boilerplate lives
+# here, in one long stable system message, with the topic appended last in
+# a minimal user message: OpenAI's automatic prompt caching hashes the
+# prompt prefix (for prompts of 1024+ tokens), so keeping the variable part
+# at the very end lets the server skip prefill on the entire shared prefix
+SYSTEM_PROMPT = (
+    "You are a professional blog writer who creates engaging, informative, "
+    "and well-structured blog posts. Your writing is clear, concise, and "
+    "engaging for a general audience of curious non-specialists. You will be "
+    "given a single blog topic; write a comprehensive blog post of "
+    "approximately 400-500 words about it.\n"
+    "\n"
+    "Structure every post as follows:\n"
+    "1. An engaging introduction that hooks the reader. Open with a concrete "
+    "detail, a surprising fact, a short scenario, or a sharp question rather "
+    "than a generic statement about how important the topic is. By the end "
+    "of the first paragraph the reader should know what the post is about "
+    "and why it is worth their next two minutes.\n"
+    "2. Well-organized main content with clear paragraphs. Develop two to "
+    "four distinct points, one per paragraph, ordered so that each builds on "
+    "the previous. Lead each paragraph with its main idea, then support it "
+    "with specifics: examples, numbers, brief comparisons, or short concrete "
+    "scenarios. Prefer one well-developed example over three vague ones.\n"
+    "3. A thoughtful conclusion that summarizes the key points. Do not "
+    "simply restate the introduction; leave the reader with a takeaway, a "
+    "practical next step, or a question worth sitting with. Never end with "
+    "the phrase 'In conclusion'.\n"
+    "\n"
+    "Style guide:\n"
+    "- Write in plain, direct language. Short sentences beat long ones. If a "
+    "sentence has more than one subordinate clause, split it.\n"
+    "- Use the active voice. 'Researchers found' rather than 'it was found "
+    "by researchers'.\n"
+    "- Be specific. 'Cut load times from eight seconds to two' is better "
+    "than 'dramatically improved performance'.\n"
+    "- Avoid filler phrases such as 'in today's fast-paced world', 'now more "
+    "than ever', 'it goes without saying', 'at the end of the day', and "
+    "'unlock the power of'. If a sentence would survive in any blog post on "
+    "any topic, delete it.\n"
+    "- Avoid unexplained jargon. If a technical term is necessary, define it "
+    "in the same sentence in everyday words.\n"
+    "- Vary sentence rhythm. Follow a long explanatory sentence with a short "
+    "emphatic one.\n"
+    "- Use contractions where they sound natural; the register is "
+    "knowledgeable but conversational, like a well-edited newsletter.\n"
+    "- Do not use headings, bullet lists, numbered lists, or markdown "
+    "formatting in the post itself; write flowing paragraphs of prose "
+    "separated by blank lines.\n"
+    "- Do not include a title unless the topic explicitly asks for one.\n"
+    "- Make every claim something a reasonable, informed person could stand "
+    "behind. When a point is genuinely contested, say so briefly rather "
+    "than pretending certainty.\n"
+    "- Numbers up to ten are written as words; larger numbers as numerals. "
+    "Spell out acronyms on first use.\n"
+    "\n"
+    "Tone calibration by topic type:\n"
+    "- For technology topics, be concrete about what the technology does and "
+    "for whom, and temper hype with at least one honest limitation.\n"
+    "- For health and wellness topics, be supportive and practical, avoid "
+    "medical advice framed as prescriptive ('consult a professional' where "
+    "appropriate), and never shame the reader.\n"
+    "- For business and productivity topics, favor actionable guidance the "
+    "reader could try this week over abstract strategy talk.\n"
+    "- For lifestyle, travel, and creative topics, lean on sensory detail "
+    "and small narrative moments to keep the writing vivid.\n"
+    "- For scientific or environmental topics, ground claims in the kind of "
+    "evidence a careful science journalist would cite, and distinguish "
+    "between what is established and what is emerging.\n"
+    "\n"
+    "Examples of strong openings (for calibration only; never reuse them "
+    "verbatim):\n"
+    "- 'The average office worker checks email 77 times a day. Most of "
+    "those checks take under ten seconds, and almost none of them matter.'\n"
+    "- 'When the power went out in Marta's building for the third time that "
+    "winter, she did something unusual: she was glad.'\n"
+    "- 'A tomato grown in July and a tomato grown in January can look "
+    "identical on the shelf. Only one of them tastes like anything.'\n"
+    "\n"
+    "Examples of weak openings to avoid:\n"
+    "- 'In today's fast-paced digital world, technology is changing the way "
+    "we live and work.'\n"
+    "- 'X is a topic that has become increasingly important in recent "
+    "years.'\n"
+    "- 'Have you ever wondered about X? In this blog post, we will explore "
+    "everything you need to know.'\n"
+    "\n"
+    "Quality bar before you finish:\n"
+    "- The post is between roughly 400 and 500 words.\n"
+    "- The first sentence would make a stranger keep reading.\n"
+    "- Each paragraph earns its place; nothing is padding.\n"
+    "- The conclusion adds something beyond a summary.\n"
+    "- The writing is informative, engaging, and easy to read aloud.\n"
+    "\n"
+    "Write the blog post about the topic provided in the user message."
+)
+
+
+# Static part of the per-request user message, hoisted so the handler does
+# a single string concatenation instead of f-string formatting per call
+_USER_PROMPT_PREFIX = "Topic: "
+
+# The system message never changes, so its message dict is built once;
+# only the user message is constructed per request
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+def build_prompt_messages(topic):
+    """Build the system/user message pair for a blog topic"""
+    return [
+        _SYSTEM_MESSAGE,
+        {"role": "user", "content": _USER_PROMPT_PREFIX + topic}
+    ]
 
 
 @app.route('/generate', methods=['POST'])
-def generate_blog():
+async def generate_blog():
     """
     Generate a blog post based on the topic provided by the user
     Returns JSON response with generated blog content or error message
@@ -122,75 +556,46 @@ def generate_blog():
     request_stats['total_requests'] += 1
     
     try:
-        # Get the blog topic from the form data
-        topic = request.form.get('topic', '').strip()
-        
-        # Sanitize input
-        topic = sanitize_input(topic)
-        
-        # Validate topic length
-        if not topic:
-            logger.warning("Empty topic received")
-            return jsonify({'error': 'Please enter a blog topic'}), 400
-        
-        if len(topic) < MIN_TOPIC_LENGTH:
-            logger.warning(f"Topic too short: {len(topic)} characters")
-            return jsonify({'error': f'Topic must be at least {MIN_TOPIC_LENGTH} characters long'}), 400
-        
-        if len(topic) > MAX_TOPIC_LENGTH:
-            logger.warning(f"Topic too long: {len(topic)} characters")
-            return jsonify({'error': f'Topic must not exceed {MAX_TOPIC_LENGTH} characters'}), 400
-        
-        logger.info(f"Generating blog for topic: {topic[:50]}...")
-        
-        # Create a well-structured prompt for the OpenAI API
-        system_prompt = (
-            "You are a professional blog writer who creates engaging, informative, "
-            "and well-structured blog posts. Your writing is clear, concise, and "
-            "engaging for a general audience."
-        )
-        
-        user_prompt = (
-            f"Write a comprehensive blog post (approximately 400-500 words) about: {topic}. "
-            "Structure it with:\n"
-            "1. An engaging introduction that hooks the reader\n"
-            "2. Well-organized main content with clear paragraphs\n"
-            "3. A thoughtful conclusion that summarizes key points\n"
-            "Make it informative, engaging, and easy to read."
-        )
-        
-        # Call OpenAI API to generate the blog post
+        # Get and validate the blog topic from the form data
+        form = await request.form
+        topic, error = validate_topic(form.get('topic', ''))
+        if error:
+            return jsonify({'error': error}), 400
+
+        # Serve repeat topics straight from the response cache
+        key = cache_key(topic)
+        cached = await cache_get(key)
+        if cached is not None:
+            request_stats['successful_requests'] += 1
+            logger.info("Cache hit for topic: %.50s", topic)
+            return jsonify({**cached, 'cached': True})
+
+        logger.info("Generating blog for topic: %.50s...", topic)
+
+        # Call OpenAI API (via the micro-batcher) to generate the blog post
         try:
-            response = client.chat.completions.create(
-                model=MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=MAX_TOKENS,
-                temperature=TEMPERATURE
-            )
+            response = await generate_completion(build_prompt_messages(topic))
         except RateLimitError as e:
             request_stats['failed_requests'] += 1
-            logger.error(f"Rate limit error: {str(e)}")
+            logger.error("Rate limit error: %s", e)
             return jsonify({
                 'error': 'API rate limit exceeded. Please try again in a moment.'
             }), 429
-        except Timeout as e:
+        except APITimeoutError as e:
             request_stats['failed_requests'] += 1
-            logger.error(f"Request timeout: {str(e)}")
+            logger.error("Request timeout: %s", e)
             return jsonify({
                 'error': 'Request timed out. The AI service is taking too long to respond. Please try again.'
             }), 504
         except APIConnectionError as e:
             request_stats['failed_requests'] += 1
-            logger.error(f"API connection error: {str(e)}")
+            logger.error("API connection error: %s", e)
             return jsonify({
                 'error': 'Connection error. Please check your internet connection and try again.'
             }), 503
         except APIError as e:
             request_stats['failed_requests'] += 1
-            logger.error(f"OpenAI API error: {str(e)}")
+            logger.error("OpenAI API error: %s", e)
             error_msg = str(e).lower()
             if 'invalid api key' in error_msg or 'authentication' in error_msg:
                 return jsonify({
@@ -214,35 +619,245 @@ def generate_blog():
             request_stats['total_tokens_used'] += response.usage.total_tokens
         
         processing_time = round(time.time() - start_time, 2)
-        logger.info(f"Successfully generated blog post ({len(blog_content)} characters) in {processing_time}s")
+        logger.info("Successfully generated blog post (%d characters) in %ss", len(blog_content), processing_time)
         
-        # Return the generated blog as JSON
-        return jsonify({
+        # Cache the payload and return the generated blog as JSON
+        payload = {
             'blog': blog_content,
             'topic': topic,
-            'word_count': len(blog_content.split()),
+            'word_count': count_words(blog_content),
             'processing_time': processing_time,
             'tokens_used': response.usage.total_tokens if hasattr(response, 'usage') and response.usage else None
-        })
+        }
+        await cache_put(key, payload)
+        return jsonify(payload)
     
     except ValueError as e:
         request_stats['failed_requests'] += 1
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         return jsonify({'error': str(e)}), 400
     except Exception as e:
         request_stats['failed_requests'] += 1
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return jsonify({
             'error': 'An unexpected error occurred. Please try again later.'
         }), 500
 
 
+# In-memory registry of submitted batch jobs: batch id -> custom_id/topic
+# mapping. Back this with Redis if the app is ever run with multiple workers
+_batch_jobs = {}
+
+
+@app.route('/generate/batch', methods=['POST'])
+async def generate_blog_batch():
+    """
+    Submit a bulk list of topics to the OpenAI Batch API
+    Accepts JSON {'topics': [...]}, uploads a JSONL input file, creates a
+    batch job (24h completion window, 50% cheaper than synchronous calls)
+    and returns a batch id the client can poll via /generate/batch/<id>
+    """
+    request_stats['total_requests'] += 1
+
+    data = await request.get_json(silent=True)
+    topics = data.get('topics') if isinstance(data, dict) else None
+    if not isinstance(topics, list) or not topics:
+        return jsonify({'error': "Request body must be JSON with a non-empty 'topics' list"}), 400
+    if len(topics) > MAX_BATCH_TOPICS:
+        return jsonify({'error': f'At most {MAX_BATCH_TOPICS} topics per batch'}), 400
+
+    # Validate every topic up front so a bad entry fails the whole
+    # submission before anything is uploaded
+    validated = []
+    for raw in topics:
+        if not isinstance(raw, str):
+            return jsonify({'error': 'Each topic must be a string'}), 400
+        topic, error = validate_topic(raw)
+        if error:
+            return jsonify({'error': f'Invalid topic {raw[:50]!r}: {error}'}), 400
+        validated.append(topic)
+
+    # Build the JSONL input: one chat-completion request per topic
+    custom_ids = {}
+    lines = []
+    for topic in validated:
+        custom_id = uuid.uuid4().hex
+        custom_ids[custom_id] = topic
+        lines.append(orjson.dumps({
+            'custom_id': custom_id,
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': {
+                'model': MODEL,
+                'messages': build_prompt_messages(topic),
+                'max_tokens': MAX_TOKENS,
+                'temperature': TEMPERATURE
+            }
+        }).decode())
+
+    try:
+        input_file = await client.files.create(
+            file=('batch_input.jsonl', '\n'.join(lines).encode()),
+            purpose='batch'
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+    except RateLimitError as e:
+        request_stats['failed_requests'] += 1
+        logger.error("Rate limit error: %s", e)
+        return jsonify({'error': 'API rate limit exceeded. Please try again in a moment.'}), 429
+    except (APIConnectionError, APITimeoutError, APIError) as e:
+        request_stats['failed_requests'] += 1
+        logger.error("Batch submission failed: %s", e)
+        return jsonify({'error': 'Error submitting batch to AI service. Please try again later.'}), 502
+
+    _batch_jobs[batch.id] = {
+        'topics': custom_ids,
+        'created_at': datetime.now().isoformat()
+    }
+    request_stats['successful_requests'] += 1
+    logger.info("Submitted batch %s with %d topics", batch.id, len(validated))
+
+    return jsonify({
+        'batch_id': batch.id,
+        'status': batch.status,
+        'topic_count': len(validated)
+    }), 202
+
+
+@app.route('/generate/batch/<batch_id>', methods=['GET'])
+async def get_blog_batch(batch_id):
+    """
+    Poll a batch job; when completed, fetch the output file and return the
+    generated blogs keyed back to their topics
+    """
+    job = _batch_jobs.get(batch_id)
+    if job is None:
+        return jsonify({'error': 'Unknown batch id'}), 404
+
+    try:
+        batch = await client.batches.retrieve(batch_id)
+    except (APIConnectionError, APITimeoutError, APIError) as e:
+        logger.error("Batch status check failed: %s", e)
+        return jsonify({'error': 'Error checking batch status. Please try again later.'}), 502
+
+    result = {'batch_id': batch_id, 'status': batch.status}
+
+    if batch.status == 'completed' and batch.output_file_id:
+        try:
+            output = await client.files.content(batch.output_file_id)
+        except (APIConnectionError, APITimeoutError, APIError) as e:
+            logger.error("Batch result download failed: %s", e)
+            return jsonify({'error': 'Error downloading batch results. Please try again later.'}), 502
+
+        results = []
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            body = (record.get('response') or {}).get('body') or {}
+            choices = body.get('choices') or []
+            content = choices[0]['message']['content'].strip() if choices else None
+            results.append({
+                'topic': job['topics'].get(record.get('custom_id')),
+                'blog': content,
+                'word_count': count_words(content) if content else 0
+            })
+        result['results'] = results
+
+    return jsonify(result)
+
+
+@app.route('/generate/stream', methods=['POST'])
+async def generate_blog_stream():
+    """
+    Generate a blog post and stream it token-by-token as Server-Sent Events
+    Each event carries a JSON payload: {'delta': ...} for content chunks,
+    {'done': True, ...} with metadata at the end, or {'error': ...} on failure
+    """
+    start_time = time.time()
+    request_stats['total_requests'] += 1
+
+    # Validate before streaming starts so input errors still get a 400
+    form = await request.form
+    topic, error = validate_topic(form.get('topic', ''))
+    if error:
+        request_stats['failed_requests'] += 1
+        return jsonify({'error': error}), 400
+
+    logger.info("Streaming blog for topic: %.50s...", topic)
+
+    async def event_stream():
+        content_parts = []
+        try:
+            messages = build_prompt_messages(topic)
+            await acquire_rate_limit(messages)
+            stream = await client.chat.completions.create(
+                model=MODEL,
+                messages=messages,
+                max_tokens=MAX_TOKENS,
+                temperature=TEMPERATURE,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    content_parts.append(delta)
+                    yield sse_event({'delta': delta})
+        except RateLimitError as e:
+            request_stats['failed_requests'] += 1
+            logger.error("Rate limit error: %s", e)
+            yield sse_event({'error': 'API rate limit exceeded. Please try again in a moment.'})
+            return
+        except APITimeoutError as e:
+            request_stats['failed_requests'] += 1
+            logger.error("Request timeout: %s", e)
+            yield sse_event({'error': 'Request timed out. The AI service is taking too long to respond. Please try again.'})
+            return
+        except (APIConnectionError, APIError) as e:
+            request_stats['failed_requests'] += 1
+            logger.error("OpenAI API error: %s", e)
+            yield sse_event({'error': 'Error communicating with AI service. Please try again later.'})
+            return
+        except Exception as e:
+            request_stats['failed_requests'] += 1
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            yield sse_event({'error': 'An unexpected error occurred. Please try again later.'})
+            return
+
+        blog_content = ''.join(content_parts).strip()
+        if not blog_content:
+            request_stats['failed_requests'] += 1
+            logger.error("Empty response from OpenAI API")
+            yield sse_event({'error': 'Received empty response from AI service'})
+            return
+
+        request_stats['successful_requests'] += 1
+        processing_time = round(time.time() - start_time, 2)
+        logger.info("Successfully streamed blog post (%d characters) in %ss", len(blog_content), processing_time)
+        yield sse_event({'done': True, 'topic': topic, 'word_count': count_words(blog_content), 'processing_time': processing_time})
+
+    headers = {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    }
+    return event_stream(), 200, headers
+
+
 if __name__ == '__main__':
-    # Run the Flask app in debug mode (for development)
-    # In production, use a proper WSGI server like Gunicorn
+    # Run the Quart app in debug mode (for development)
+    # In production, serve under Gunicorn with async Uvicorn workers:
+    #   gunicorn -k uvicorn.workers.UvicornWorker -w $((2*$(nproc)+1)) \
+    #       --worker-connections 1000 --keep-alive 75 -b 0.0.0.0:$PORT app:app
     port = int(os.getenv('PORT', 5000))
-    debug_mode = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
-    
-    logger.info(f"Starting Flask app on port {port} (debug={debug_mode})")
+    debug_mode = os.getenv('QUART_DEBUG', os.getenv('FLASK_DEBUG', 'True')).lower() == 'true'
+
+    logger.info("Starting Quart app on port %d (debug=%s)", port, debug_mode)
     app.run(debug=debug_mode, host='0.0.0.0', port=port)
 
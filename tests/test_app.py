@@ -0,0 +1,66 @@
+"""
+Smoke tests guarding the hardened request path in app.py
+Asserts that sanitization, the topic limits and the validation error
+handling stay wired so an unvalidated variant can never ship unnoticed
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault('OPENAI_API_KEY', 'sk-test')
+
+import app
+
+
+def test_sanitize_input_is_wired():
+    assert callable(app.sanitize_input)
+    # Control characters are stripped, whitespace runs collapse to one space
+    assert app.sanitize_input("abc\x00\x1fdef") == "abcdef"
+    assert app.sanitize_input("  spaced   \n out  ") == "spaced out"
+    assert app.sanitize_input("") == ""
+
+
+def test_sanitize_input_does_not_cache_oversized_input():
+    app._sanitize_input_cached.cache_clear()
+    oversized = "word " * app.MAX_TOPIC_LENGTH
+    assert app.sanitize_input(oversized) == oversized.strip()
+    assert app._sanitize_input_cached.cache_info().currsize == 0
+
+    app.sanitize_input("a small topic")
+    assert app._sanitize_input_cached.cache_info().currsize == 1
+
+
+def test_topic_limits_are_wired():
+    assert app.MAX_TOPIC_LENGTH == 200
+    assert app.MIN_TOPIC_LENGTH == 3
+
+    topic, error = app.validate_topic("a reasonable topic")
+    assert topic == "a reasonable topic" and error is None
+
+    assert app.validate_topic("")[1] is not None
+    assert app.validate_topic("ab")[1] is not None
+    assert app.validate_topic("x" * 300)[1] is not None
+
+
+def test_generate_rejects_invalid_topic_with_400():
+    async def run():
+        test_client = app.app.test_client()
+        response = await test_client.post('/generate', form={'topic': 'x'})
+        body = await response.get_json()
+        return response.status_code, body
+
+    status, body = asyncio.run(run())
+    assert status == 400
+    assert 'error' in body
+
+
+def test_stream_rejects_invalid_topic_with_400():
+    async def run():
+        test_client = app.app.test_client()
+        response = await test_client.post('/generate/stream', form={'topic': ''})
+        body = await response.get_json()
+        return response.status_code, body
+
+    status, body = asyncio.run(run())
+    assert status == 400
+    assert 'error' in body